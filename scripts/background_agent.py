@@ -9,7 +9,6 @@ Continuous orchestrator:
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
 import time
 from datetime import datetime, timezone
@@ -20,6 +19,14 @@ SCRIPTS_DIR = ROOT / "scripts"
 LOG_DIR = ROOT / "data" / "agent"
 LOOP_LOG = LOG_DIR / "background-loop.log"
 
+# Import both stages once so interpreter startup, sklearn/numpy imports,
+# compiled regexes and LRU caches are paid once and stay warm across cycles
+# instead of being rebuilt by a fresh subprocess every cycle.
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import curation_agent  # noqa: E402
+import scrape_reddit_raw  # noqa: E402
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run scrape + curation continuously.")
@@ -33,64 +40,60 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+_loop_log_handle = None
+
+
 def log(message: str) -> None:
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    # Keep one open handle for the loop log instead of reopening per line.
+    global _loop_log_handle
+    if _loop_log_handle is None:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        _loop_log_handle = LOOP_LOG.open("a", encoding="utf-8")
     stamp = datetime.now(timezone.utc).isoformat()
     line = f"[{stamp}] {message}"
     print(line, flush=True)
-    with LOOP_LOG.open("a", encoding="utf-8") as handle:
-        handle.write(line + "\n")
-
-
-def run_step(command: list[str]) -> int:
-    proc = subprocess.run(command, cwd=str(ROOT))
-    return proc.returncode
+    _loop_log_handle.write(line + "\n")
+    _loop_log_handle.flush()
 
 
 def main() -> None:
     args = parse_args()
 
-    scraper = SCRIPTS_DIR / "scrape_reddit_raw.py"
-    curator = SCRIPTS_DIR / "curation_agent.py"
-
-    if not scraper.exists() or not curator.exists():
-        print("Required scripts are missing.", file=sys.stderr)
-        sys.exit(1)
+    scrape_args = argparse.Namespace(
+        posts_per_subreddit=args.posts_per_subreddit,
+        comments_per_post=args.comments_per_post,
+        sleep=0.5,
+        max_retries=2,
+        min_length=45,
+        subreddits="",
+        max_subreddits=0,
+        include_general=True,
+        sample_size=args.sample_size,
+    )
+    curate_args = argparse.Namespace(
+        batch_size=args.batch_size,
+        item_delay=0.25,
+        cycle_delay=args.cycle_delay,
+        continuous=False,
+        min_complaints=args.min_complaints,
+        openai_model=args.openai_model,
+    )
 
     log("Background agent started")
     while True:
-        scrape_cmd = [
-            sys.executable,
-            str(scraper),
-            "--posts-per-subreddit",
-            str(args.posts_per_subreddit),
-            "--comments-per-post",
-            str(args.comments_per_post),
-            "--sleep",
-            "0.5",
-            "--max-retries",
-            "2",
-            "--include-general",
-            "--sample-size",
-            str(args.sample_size),
-        ]
         log("Running scraper cycle")
-        scrape_rc = run_step(scrape_cmd)
-        log(f"Scraper exit code: {scrape_rc}")
-
-        curate_cmd = [
-            sys.executable,
-            str(curator),
-            "--batch-size",
-            str(args.batch_size),
-            "--min-complaints",
-            str(args.min_complaints),
-            "--openai-model",
-            args.openai_model,
-        ]
+        try:
+            scrape_reddit_raw.main(scrape_args)
+            log("Scraper cycle complete")
+        except Exception as exc:
+            log(f"Scraper cycle failed: {exc}")
+
         log("Running curation cycle")
-        curate_rc = run_step(curate_cmd)
-        log(f"Curation exit code: {curate_rc}")
+        try:
+            curation_agent.run_once(curate_args)
+            log("Curation cycle complete")
+        except Exception as exc:
+            log(f"Curation cycle failed: {exc}")
 
         log(f"Sleeping {args.cycle_delay:.1f}s before next cycle")
         time.sleep(args.cycle_delay)
@@ -17,79 +17,132 @@ Behavior:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import http.client
 import json
+import math
 import os
 import re
 import time
-import urllib.error
-import urllib.request
 from collections import Counter, defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+from scipy.sparse.csgraph import connected_components
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; regex fallback below
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json fallback below
+    orjson = None
+
+try:
+    import polars as pl
+except ImportError:  # optional; read_jsonl fallback below
+    pl = None
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data" / "agent"
 QUEUE_FILE = DATA_DIR / "queue.jsonl"
+QUEUE_CURSOR_FILE = DATA_DIR / "queue.cursor"
 PROBLEM_FILE = DATA_DIR / "problems.jsonl"
 DELETED_FILE = DATA_DIR / "deleted.jsonl"
 AUDIT_FILE = DATA_DIR / "audit.jsonl"
+CLUSTER_CACHE_FILE = DATA_DIR / "cluster_cache.json"
+
+# LRU bound for cached cluster titles/summaries.
+CLUSTER_CACHE_MAX = 5000
 
 # Frontend output consumed by app.js
 CURATED_JSON = ROOT / "data" / "reddit-problems.json"
 CURATED_JS = ROOT / "reddit-problems.js"
 CURATED_CANDIDATE_JSON = ROOT / "data" / "reddit-problems-candidates.json"
 
+# Compact the queue once this many consumed bytes pile up before the cursor.
+QUEUE_COMPACT_BYTES = 8 * 1024 * 1024
+
+# The discriminative signal for clustering lives in the first few hundred
+# chars; cap what the tokenizers see so cost scales with that, not comment length.
+MAX_CLUSTER_TEXT_CHARS = 800
+
+# Each category compiles to one alternation so a text is scanned once per
+# category instead of once per pattern.
 COMPLAINT_PATTERNS = [
-    re.compile(r"\bproblem(s)?\b", re.IGNORECASE),
-    re.compile(r"\bissue(s)?\b", re.IGNORECASE),
-    re.compile(r"\bstruggl(e|ing|ed)\b", re.IGNORECASE),
-    re.compile(r"\bfrustrat(ed|ing|ion)\b", re.IGNORECASE),
-    re.compile(r"\b(can't|cannot|unable|won't|doesn't)\b", re.IGNORECASE),
-    re.compile(r"\b(delay|late|backlog|slow)\b", re.IGNORECASE),
-    re.compile(r"\b(expensive|costly|too much)\b", re.IGNORECASE),
-    re.compile(r"\bnot working\b", re.IGNORECASE),
+    r"\bproblem(?:s)?\b",
+    r"\bissue(?:s)?\b",
+    r"\bstruggl(?:e|ing|ed)\b",
+    r"\bfrustrat(?:ed|ing|ion)\b",
+    r"\b(?:can't|cannot|unable|won't|doesn't)\b",
+    r"\b(?:delay|late|backlog|slow)\b",
+    r"\b(?:expensive|costly|too much)\b",
+    r"\bnot working\b",
 ]
+COMPLAINT_RE = re.compile("|".join(f"(?:{p})" for p in COMPLAINT_PATTERNS), re.IGNORECASE)
 
 SOLUTION_PATTERNS = [
-    re.compile(r"\bsolution\b", re.IGNORECASE),
-    re.compile(r"\bfix\b", re.IGNORECASE),
-    re.compile(r"\bwe solved\b", re.IGNORECASE),
-    re.compile(r"\bwhat worked\b", re.IGNORECASE),
-    re.compile(r"\btry\b", re.IGNORECASE),
-    re.compile(r"\byou should\b", re.IGNORECASE),
-    re.compile(r"\bbuild\b", re.IGNORECASE),
-    re.compile(r"\bautomate\b", re.IGNORECASE),
-    re.compile(r"\bapproach\b", re.IGNORECASE),
-    re.compile(r"\bidea\b", re.IGNORECASE),
-    re.compile(r"\bwe use\b", re.IGNORECASE),
+    r"\bsolution\b",
+    r"\bfix\b",
+    r"\bwe solved\b",
+    r"\bwhat worked\b",
+    r"\btry\b",
+    r"\byou should\b",
+    r"\bbuild\b",
+    r"\bautomate\b",
+    r"\bapproach\b",
+    r"\bidea\b",
+    r"\bwe use\b",
 ]
+SOLUTION_RE = re.compile("|".join(f"(?:{p})" for p in SOLUTION_PATTERNS), re.IGNORECASE)
 
 BUSINESS_PATTERNS = [
-    re.compile(r"\bcustomer(s)?\b", re.IGNORECASE),
-    re.compile(r"\bclient(s)?\b", re.IGNORECASE),
-    re.compile(r"\bstartup\b", re.IGNORECASE),
-    re.compile(r"\bsmall business\b", re.IGNORECASE),
-    re.compile(r"\bmarketing\b", re.IGNORECASE),
-    re.compile(r"\blead(s)?\b", re.IGNORECASE),
-    re.compile(r"\bsales?\b", re.IGNORECASE),
-    re.compile(r"\binvoice\b", re.IGNORECASE),
-    re.compile(r"\bpayment(s)?\b", re.IGNORECASE),
-    re.compile(r"\bworkflow\b", re.IGNORECASE),
-    re.compile(r"\bprocess(es)?\b", re.IGNORECASE),
-    re.compile(r"\bfreelanc(e|er)\b", re.IGNORECASE),
-    re.compile(r"\binventory\b", re.IGNORECASE),
-    re.compile(r"\blogistics\b", re.IGNORECASE),
-    re.compile(r"\bshipping\b", re.IGNORECASE),
-    re.compile(r"\bsaas\b", re.IGNORECASE),
-    re.compile(r"\bsoftware\b", re.IGNORECASE),
-    re.compile(r"\boperations?\b", re.IGNORECASE),
-    re.compile(r"\bmargins?\b", re.IGNORECASE),
-    re.compile(r"\bpricing\b", re.IGNORECASE),
+    r"\bcustomer(?:s)?\b",
+    r"\bclient(?:s)?\b",
+    r"\bstartup\b",
+    r"\bsmall business\b",
+    r"\bmarketing\b",
+    r"\blead(?:s)?\b",
+    r"\bsales?\b",
+    r"\binvoice\b",
+    r"\bpayment(?:s)?\b",
+    r"\bworkflow\b",
+    r"\bprocess(?:es)?\b",
+    r"\bfreelanc(?:e|er)\b",
+    r"\binventory\b",
+    r"\blogistics\b",
+    r"\bshipping\b",
+    r"\bsaas\b",
+    r"\bsoftware\b",
+    r"\boperations?\b",
+    r"\bmargins?\b",
+    r"\bpricing\b",
 ]
+BUSINESS_RE = re.compile("|".join(f"(?:{p})" for p in BUSINESS_PATTERNS), re.IGNORECASE)
+
+# Cheap substring prefilters covering every stem the category regexes can
+# match: if none appear in the lowercased text, the regex sweep is skipped.
+_ANY_COMPLAINT_KW = (
+    "problem", "issue", "struggl", "frustrat", "can't", "cannot", "unable", "won't",
+    "doesn't", "delay", "late", "backlog", "slow", "expensive", "costly", "too much",
+    "not working",
+)
+_ANY_SOLUTION_KW = (
+    "solution", "fix", "we solved", "what worked", "try", "you should", "build",
+    "automate", "approach", "idea", "we use",
+)
+_ANY_BUSINESS_KW = (
+    "customer", "client", "startup", "small business", "marketing", "lead", "sale",
+    "invoice", "payment", "workflow", "process", "freelanc", "inventory", "logistics",
+    "shipping", "saas", "software", "operation", "margin", "pricing",
+)
 
 ROLE_KEYWORDS = {
     "Full-Stack Engineer": ["build", "app", "website", "platform", "software", "automation", "tool"],
@@ -103,6 +156,27 @@ ROLE_KEYWORDS = {
     "Finance/Compliance": ["compliance", "legal", "invoice", "payment", "accounting", "tax"],
 }
 
+# One automaton (or alternation regex) scans a text once for every role
+# keyword instead of 9 roles x ~5 `keyword in body` substring passes.
+_ROLE_KEYWORD_TO_ROLES: Dict[str, List[str]] = {}
+for _role, _keywords in ROLE_KEYWORDS.items():
+    for _kw in _keywords:
+        _ROLE_KEYWORD_TO_ROLES.setdefault(_kw, []).append(_role)
+
+if ahocorasick is not None:
+    _ROLE_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _ROLE_KEYWORD_TO_ROLES:
+        _ROLE_AUTOMATON.add_word(_kw, _kw)
+    _ROLE_AUTOMATON.make_automaton()
+    _ROLE_KEYWORD_RE = None
+else:
+    _ROLE_AUTOMATON = None
+    # Lookahead so matches can overlap (e.g. "ui" inside "build"), keeping
+    # the same every-occurrence substring semantics as the automaton path.
+    _ROLE_KEYWORD_RE = re.compile(
+        "(?=(" + "|".join(sorted(map(re.escape, _ROLE_KEYWORD_TO_ROLES), key=len, reverse=True)) + "))"
+    )
+
 STOPWORDS = {
     "the", "and", "that", "this", "with", "from", "have", "been", "they", "them", "into", "their", "there",
     "what", "when", "where", "which", "about", "were", "your", "you", "our", "for", "while", "over", "across",
@@ -111,12 +185,13 @@ STOPWORDS = {
 }
 
 JUNK_PATTERNS = [
-    re.compile(r"this is a friendly reminder that r\/", re.IGNORECASE),
-    re.compile(r"i am a bot[, ]", re.IGNORECASE),
-    re.compile(r"automoderator", re.IGNORECASE),
-    re.compile(r"removed automatically", re.IGNORECASE),
-    re.compile(r"be respectful and follow the rules", re.IGNORECASE),
+    r"this is a friendly reminder that r\/",
+    r"i am a bot[, ]",
+    r"automoderator",
+    r"removed automatically",
+    r"be respectful and follow the rules",
 ]
+JUNK_RE = re.compile("|".join(f"(?:{p})" for p in JUNK_PATTERNS), re.IGNORECASE)
 
 
 def parse_args() -> argparse.Namespace:
@@ -130,49 +205,191 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def json_dumps_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
 def read_jsonl(path: Path) -> List[dict]:
     if not path.exists():
         return []
     items: List[dict] = []
-    with path.open("r", encoding="utf-8") as handle:
+    with path.open("rb") as handle:
         for line in handle:
             line = line.strip()
             if not line:
                 continue
             try:
-                items.append(json.loads(line))
-            except json.JSONDecodeError:
+                items.append(json_loads(line))
+            except ValueError:
                 continue
     return items
 
 
-def write_jsonl(path: Path, items: List[dict]) -> None:
+def write_json_array(path: Path, items: List[dict], prefix: bytes = b"", suffix: bytes = b"") -> None:
+    """Stream a JSON array to disk one element at a time.
+
+    Avoids rendering the whole indented document in memory before the
+    first byte hits the file.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
+    with path.open("wb", buffering=1 << 20) as handle:
+        handle.write(prefix + b"[")
+        first = True
         for item in items:
-            handle.write(json.dumps(item, ensure_ascii=False) + "\n")
+            if not first:
+                handle.write(b",")
+            handle.write(json_dumps_bytes(item))
+            first = False
+        handle.write(b"]" + suffix)
+
+
+# The only record fields the rebuild pipeline reads; everything else
+# (classification, reason, roles, ...) stays on disk.
+PROBLEM_COLUMNS = ["id", "text", "score", "createdUtc", "subreddit", "sectorHint", "postTitle", "sourceUrl", "author"]
+
+_EXCLUDED_AUTHORS = {"automoderator", "moderator"}
+
+
+def load_problem_records() -> List[dict]:
+    """Load problem records minus moderator noise, projected to PROBLEM_COLUMNS.
+
+    With polars installed this streams the NDJSON file and filters/projects
+    before materializing; otherwise it falls back to read_jsonl.
+    """
+    if pl is not None and PROBLEM_FILE.exists():
+        try:
+            df = (
+                pl.scan_ndjson(PROBLEM_FILE)
+                .filter(pl.col("author").str.to_lowercase().is_in(sorted(_EXCLUDED_AUTHORS)).not_())
+                .select(PROBLEM_COLUMNS)
+                .collect(streaming=True)
+            )
+            return df.to_dicts()
+        except Exception:
+            pass
+
+    return [
+        {col: p.get(col) for col in PROBLEM_COLUMNS}
+        for p in read_jsonl(PROBLEM_FILE)
+        if str(p.get("author") or "").lower() not in _EXCLUDED_AUTHORS
+    ]
+
+
+def load_cluster_cache() -> Dict[str, dict]:
+    try:
+        data = json.loads(CLUSTER_CACHE_FILE.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cluster_cache(cache: Dict[str, dict]) -> None:
+    # Insertion order doubles as recency order; drop the oldest entries.
+    while len(cache) > CLUSTER_CACHE_MAX:
+        cache.pop(next(iter(cache)))
+    CLUSTER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CLUSTER_CACHE_FILE.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+
+
+def read_cursor(path: Path) -> int:
+    try:
+        return max(0, int(path.read_text(encoding="utf-8").strip() or 0))
+    except (OSError, ValueError):
+        return 0
+
+
+def write_cursor(path: Path, offset: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(str(offset), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_batch_from_cursor(queue_file: Path, cursor_file: Path, batch_size: int) -> Tuple[List[dict], int]:
+    """Read up to batch_size queued items starting at the stored byte offset.
+
+    The queue is append-only; consumed lines are skipped via the cursor
+    instead of rewriting the whole file each cycle. Returns the parsed
+    items plus the offset just past the last line read.
+    """
+    if not queue_file.exists():
+        return [], 0
+
+    offset = read_cursor(cursor_file)
+    if offset > queue_file.stat().st_size:
+        # Queue was rewritten underneath us; start over.
+        offset = 0
+
+    items: List[dict] = []
+    with queue_file.open("rb") as handle:
+        handle.seek(offset)
+        while len(items) < batch_size:
+            line = handle.readline()
+            if not line:
+                break
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                items.append(json_loads(stripped))
+            except ValueError:
+                continue
+        new_offset = handle.tell()
+    return items, new_offset
+
+
+def compact_queue(queue_file: Path, cursor_file: Path, offset: int) -> int:
+    """Drop consumed bytes once the cursor is deep into the file."""
+    if offset < QUEUE_COMPACT_BYTES:
+        return offset
+
+    tmp = queue_file.with_name(queue_file.name + ".tmp")
+    with queue_file.open("rb") as src, tmp.open("wb") as dst:
+        src.seek(offset)
+        while True:
+            chunk = src.read(1024 * 1024)
+            if not chunk:
+                break
+            dst.write(chunk)
+    os.replace(tmp, queue_file)
+    write_cursor(cursor_file, 0)
+    return 0
 
 
 def append_jsonl(path: Path, items: List[dict]) -> None:
     if not items:
         return
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        for item in items:
-            handle.write(json.dumps(item, ensure_ascii=False) + "\n")
+    # Serialize the whole batch up front so the append is one write call
+    # instead of one small write (and potential syscall) per record.
+    payload = b"\n".join(json_dumps_bytes(item) for item in items) + b"\n"
+    with path.open("ab", buffering=256 * 1024) as handle:
+        handle.write(payload)
+
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_TOKEN_RE = re.compile(r"[a-zA-Z]{3,}")
 
 
+@functools.lru_cache(maxsize=8192)
 def slugify(value: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    slug = _SLUG_RE.sub("-", value.lower()).strip("-")
     return slug[:90] or "issue"
 
 
-def count_hits(text: str, patterns: List[re.Pattern]) -> int:
-    return sum(1 for p in patterns if p.search(text))
+def count_hits(text: str, pattern: re.Pattern) -> int:
+    return sum(1 for _ in pattern.finditer(text))
 
 
+@functools.lru_cache(maxsize=8192)
 def derive_issue_title(text: str) -> str:
-    tokens = re.findall(r"[a-zA-Z]{3,}", text.lower())
+    tokens = _TOKEN_RE.findall(text.lower())
     filtered = [token for token in tokens if token not in STOPWORDS]
     if not filtered:
         return "Operational Friction"
@@ -187,10 +404,15 @@ def derive_issue_title(text: str) -> str:
 
 def detect_roles(text: str, sector_hint: str) -> List[str]:
     body = text.lower()
-    roles: List[str] = []
-    for role, keywords in ROLE_KEYWORDS.items():
-        if any(keyword in body for keyword in keywords):
-            roles.append(role)
+    if _ROLE_AUTOMATON is not None:
+        matched_keywords = (kw for _, kw in _ROLE_AUTOMATON.iter(body))
+    else:
+        matched_keywords = (m.group(1) for m in _ROLE_KEYWORD_RE.finditer(body))
+
+    hit_roles = set()
+    for kw in matched_keywords:
+        hit_roles.update(_ROLE_KEYWORD_TO_ROLES[kw])
+    roles = [role for role in ROLE_KEYWORDS if role in hit_roles]
     if len(roles) >= 3:
         return roles[:3]
 
@@ -213,8 +435,7 @@ def detect_roles(text: str, sector_hint: str) -> List[str]:
 
 
 def classify_heuristic(text: str, sector_hint: str) -> dict:
-    lower_text = text.lower()
-    if any(pattern.search(lower_text) for pattern in JUNK_PATTERNS):
+    if JUNK_RE.search(text):
         return {
             "label": "not_related",
             "confidence": 0.95,
@@ -223,9 +444,10 @@ def classify_heuristic(text: str, sector_hint: str) -> dict:
             "roles": [],
         }
 
-    business = count_hits(text, BUSINESS_PATTERNS)
-    complaint = count_hits(text, COMPLAINT_PATTERNS)
-    solution = count_hits(text, SOLUTION_PATTERNS)
+    lower_text = text.lower()
+    business = count_hits(text, BUSINESS_RE) if any(k in lower_text for k in _ANY_BUSINESS_KW) else 0
+    complaint = count_hits(text, COMPLAINT_RE) if any(k in lower_text for k in _ANY_COMPLAINT_KW) else 0
+    solution = count_hits(text, SOLUTION_RE) if any(k in lower_text for k in _ANY_SOLUTION_KW) else 0
 
     if solution >= complaint + 1 and solution > 0:
         return {
@@ -272,54 +494,43 @@ def classify_heuristic(text: str, sector_hint: str) -> dict:
     }
 
 
-def classify_openai(text: str, sector_hint: str, model: str) -> Optional[dict]:
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        return None
+# Items packed into one OpenAI request; each extra item costs tokens, not a
+# full HTTPS round-trip.
+OPENAI_BATCH_SIZE = 10
 
-    payload = {
-        "model": model,
-        "temperature": 0,
-        "messages": [
-            {
-                "role": "system",
-                "content": (
-                    "Classify the Reddit comment as exactly one label: problem, solution, or not_related. "
-                    "Return compact JSON with keys: label, confidence, reason, issue_title, roles. "
-                    "roles must be an array of role strings (empty if not needed). "
-                    "issue_title should be a short underlying issue title."
-                ),
-            },
-            {
-                "role": "user",
-                "content": json.dumps({"sector_hint": sector_hint, "comment": text}),
-            },
-        ],
-        "response_format": {"type": "json_object"},
-    }
+# Kept-alive connection to api.openai.com, reused across batches and cycles.
+_openai_conn: Optional[http.client.HTTPSConnection] = None
 
-    req = urllib.request.Request(
-        "https://api.openai.com/v1/chat/completions",
-        data=json.dumps(payload).encode("utf-8"),
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
 
-    try:
-        with urllib.request.urlopen(req, timeout=40) as response:
-            body = json.loads(response.read().decode("utf-8"))
-    except Exception:
-        return None
+def _openai_request(payload: dict, api_key: str) -> Optional[dict]:
+    global _openai_conn
+    body = json.dumps(payload)
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+    for _ in range(2):
+        try:
+            if _openai_conn is None:
+                _openai_conn = http.client.HTTPSConnection("api.openai.com", timeout=60)
+            _openai_conn.request("POST", "/v1/chat/completions", body=body, headers=headers)
+            response = _openai_conn.getresponse()
+            data = response.read()
+            if response.status != 200:
+                return None
+            return json.loads(data.decode("utf-8"))
+        except Exception:
+            # Stale keep-alive socket or transient failure; reconnect once.
+            try:
+                _openai_conn.close()
+            except Exception:
+                pass
+            _openai_conn = None
+    return None
 
-    try:
-        content = body["choices"][0]["message"]["content"]
-        parsed = json.loads(content)
-    except Exception:
-        return None
 
+def _normalize_llm_result(parsed: dict, text: str) -> Optional[dict]:
     label = str(parsed.get("label", "")).strip().lower()
     if label not in {"problem", "solution", "not_related"}:
         return None
@@ -336,107 +547,184 @@ def classify_openai(text: str, sector_hint: str, model: str) -> Optional[dict]:
     }
 
 
-def classify_item(text: str, sector_hint: str, model: str) -> dict:
-    llm = classify_openai(text, sector_hint, model=model)
-    if llm:
-        if llm["label"] == "solution" and not llm["roles"]:
-            llm["roles"] = detect_roles(text, sector_hint)
-        return llm
-    return classify_heuristic(text, sector_hint)
+def classify_openai_batch(items: List[Tuple[str, str]], model: str) -> List[Optional[dict]]:
+    """Classify (text, sector_hint) pairs in one request per OPENAI_BATCH_SIZE.
 
+    Returns one result per input item, None where the LLM gave no usable
+    answer (callers fall back to the heuristic for those).
+    """
+    results: List[Optional[dict]] = [None] * len(items)
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key or not items:
+        return results
+
+    for start in range(0, len(items), OPENAI_BATCH_SIZE):
+        chunk = items[start : start + OPENAI_BATCH_SIZE]
+        payload = {
+            "model": model,
+            "temperature": 0,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "Classify each Reddit comment as exactly one label: problem, solution, or not_related. "
+                        'Return compact JSON {"results": [{"i": <input index>, "label", "confidence", '
+                        '"reason", "issue_title", "roles"}, ...]} with one entry per input item. '
+                        "roles must be an array of role strings (empty if not needed). "
+                        "issue_title should be a short underlying issue title."
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": json.dumps(
+                        {
+                            "items": [
+                                {"i": i, "sector_hint": sector, "comment": text}
+                                for i, (text, sector) in enumerate(chunk)
+                            ]
+                        }
+                    ),
+                },
+            ],
+            "response_format": {"type": "json_object"},
+        }
 
-class UnionFind:
-    def __init__(self, n: int) -> None:
-        self.parent = list(range(n))
-        self.rank = [0] * n
+        body = _openai_request(payload, api_key)
+        if not body:
+            continue
 
-    def find(self, x: int) -> int:
-        while self.parent[x] != x:
-            self.parent[x] = self.parent[self.parent[x]]
-            x = self.parent[x]
-        return x
+        try:
+            content = body["choices"][0]["message"]["content"]
+            parsed = json.loads(content)
+            entries = parsed.get("results") or []
+        except Exception:
+            continue
 
-    def union(self, a: int, b: int) -> None:
-        ra, rb = self.find(a), self.find(b)
-        if ra == rb:
-            return
-        if self.rank[ra] < self.rank[rb]:
-            ra, rb = rb, ra
-        self.parent[rb] = ra
-        if self.rank[ra] == self.rank[rb]:
-            self.rank[ra] += 1
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                local_idx = int(entry.get("i"))
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= local_idx < len(chunk):
+                continue
+            results[start + local_idx] = _normalize_llm_result(entry, chunk[local_idx][0])
 
+    return results
 
-def _cluster_title(texts: List[str]) -> str:
-    if not texts:
-        return "Operational Friction"
 
-    try:
-        vec = TfidfVectorizer(stop_words="english", ngram_range=(2, 4), min_df=1, max_features=2500)
-        mat = vec.fit_transform(texts)
-        scores = mat.sum(axis=0).A1
-        terms = vec.get_feature_names_out()
-        ranked = sorted(
-            ((t, float(s)) for t, s in zip(terms, scores) if t),
-            key=lambda x: x[1],
-            reverse=True,
+def classify_batch(items: List[Tuple[str, str]], model: str) -> List[dict]:
+    llm_results = classify_openai_batch(items, model=model)
+    results: List[dict] = []
+    for (text, sector_hint), llm in zip(items, llm_results):
+        if llm:
+            if llm["label"] == "solution" and not llm["roles"]:
+                llm["roles"] = detect_roles(text, sector_hint)
+            results.append(llm)
+        else:
+            results.append(classify_heuristic(text, sector_hint))
+    return results
+
+
+def _iter_ngrams(tokens: List[str], lo: int = 1, hi: int = 4):
+    n = len(tokens)
+    for size in range(lo, hi + 1):
+        for i in range(n - size + 1):
+            yield tuple(tokens[i : i + size])
+
+
+def _build_ngram_df(tokens_all: List[List[str]]) -> Counter:
+    """Document frequency of 1-4 grams across the whole corpus."""
+    df: Counter = Counter()
+    for tokens in tokens_all:
+        df.update(set(_iter_ngrams(tokens)))
+    return df
+
+
+def _top_cluster_grams(
+    idxs: List[int],
+    tokens_all: List[List[str]],
+    ngram_df: Counter,
+    n_docs: int,
+    lo: int,
+    hi: int,
+    k: int,
+) -> List[Tuple[str, ...]]:
+    """Top-k n-grams for a cluster by tf * idf against the global df table.
+
+    Clusters are small (a handful of texts), so a local Counter plus one
+    pass over its entries beats building a sparse matrix per cluster.
+    """
+    tf: Counter = Counter()
+    for i in idxs:
+        tf.update(_iter_ngrams(tokens_all[i], lo, hi))
+    scored = [
+        (count * math.log(n_docs / (1 + ngram_df[gram])), gram)
+        for gram, count in tf.items()
+    ]
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [gram for score, gram in scored[:k] if score > 0]
+
+
+def _cluster_title(idxs: List[int], tokens_all: List[List[str]], ngram_df: Counter, n_docs: int) -> Optional[str]:
+    # Titles want multi-word phrases, so only score 2-4 grams here.
+    for gram in _top_cluster_grams(idxs, tokens_all, ngram_df, n_docs, 2, 4, 1):
+        return " ".join(gram[:6]).title()
+    return None
+
+
+def _cluster_summary(
+    idxs: List[int],
+    tokens_all: List[List[str]],
+    ngram_df: Counter,
+    n_docs: int,
+    complaint_count: int,
+    subreddit_count: int,
+) -> str:
+    top_terms = [" ".join(gram) for gram in _top_cluster_grams(idxs, tokens_all, ngram_df, n_docs, 1, 2, 3)]
+    if top_terms:
+        return (
+            f"Recurring complaints mention {', '.join(top_terms)}. "
+            f"Evidence: {complaint_count} comments across {subreddit_count} subreddits."
         )
-        if ranked:
-            phrase = ranked[0][0].strip()
-            words = phrase.split()
-            if len(words) > 6:
-                phrase = " ".join(words[:6])
-            return phrase.title()
-    except Exception:
-        pass
-
-    return derive_issue_title(" ".join(texts[:5]))
-
-
-def _cluster_summary(texts: List[str], complaint_count: int, subreddit_count: int) -> str:
-    try:
-        vec = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), min_df=1, max_features=4000)
-        mat = vec.fit_transform(texts)
-        scores = mat.sum(axis=0).A1
-        terms = vec.get_feature_names_out()
-        ranked = sorted(zip(terms, scores), key=lambda x: x[1], reverse=True)
-        top_terms = [term for term, _ in ranked[:5]]
-        if top_terms:
-            return (
-                f"Recurring complaints mention {', '.join(top_terms[:3])}. "
-                f"Evidence: {complaint_count} comments across {subreddit_count} subreddits."
-            )
-    except Exception:
-        pass
     return f"Recurring complaints detected from {complaint_count} Reddit comments across {subreddit_count} subreddits."
 
 
-def _cluster_problem_records(problem_items: List[dict], threshold: float = 0.24) -> Tuple[List[List[int]], TfidfVectorizer, object]:
-    texts = [str(x.get("text") or "") for x in problem_items]
-    vec = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), min_df=2, max_df=0.93, max_features=10000)
-    mat = vec.fit_transform(texts)
+def _cluster_problem_records(texts: List[str], threshold: float = 0.24) -> Tuple[List[List[int]], TfidfVectorizer, object]:
+    vec = TfidfVectorizer(
+        stop_words="english",
+        ngram_range=(1, 2),
+        min_df=2,
+        max_df=0.93,
+        max_features=10000,
+        dtype=np.float32,
+    )
+    mat = vec.fit_transform([t[:MAX_CLUSTER_TEXT_CHARS] for t in texts])
 
-    n = len(problem_items)
+    n = len(texts)
     if n <= 1:
         return ([list(range(n))] if n else []), vec, mat
 
-    sim = cosine_similarity(mat)
-    uf = UnionFind(n)
-    for i in range(n):
-        row = sim[i]
-        for j in range(i + 1, n):
-            if row[j] >= threshold:
-                uf.union(i, j)
-
+    # Sparse neighbor search: L2-normalize rows so mat @ mat.T is cosine
+    # similarity, then keep only entries above threshold. Memory stays
+    # O(nnz) instead of the dense n x n matrix.
+    normalize(mat, norm="l2", copy=False)
+    sim = (mat @ mat.T).tocsr()
+    sim.data[sim.data < threshold] = 0
+    sim.eliminate_zeros()
+
+    # The thresholded similarity matrix is an adjacency graph; clusters are
+    # its connected components, computed at C level over the CSR arrays.
+    _, labels = connected_components(sim, directed=False)
     grouped: Dict[int, List[int]] = defaultdict(list)
-    for i in range(n):
-        grouped[uf.find(i)].append(i)
+    for i, label in enumerate(labels):
+        grouped[int(label)].append(i)
     return list(grouped.values()), vec, mat
 
 
 def rebuild_curated_issues(min_complaints: int) -> None:
-    problems = read_jsonl(PROBLEM_FILE)
-    problems = [p for p in problems if str(p.get("author") or "").lower() not in {"automoderator", "moderator"}]
+    problems = load_problem_records()
 
     if not problems:
         CURATED_JSON.parent.mkdir(parents=True, exist_ok=True)
@@ -445,27 +733,76 @@ def rebuild_curated_issues(min_complaints: int) -> None:
         CURATED_CANDIDATE_JSON.write_text("[]", encoding="utf-8")
         return
 
+    # Parallel columns so the hot paths below don't re-stringify and re-cast
+    # the same dict fields once per cluster.
+    texts_all = [str(p.get("text") or "") for p in problems]
+    scores_all = [int(p.get("score") or 0) for p in problems]
+    created_all = [float(p.get("createdUtc") or 0) for p in problems]
+
     # Semantic clustering for underlying issues.
     try:
-        cluster_indices, _, _ = _cluster_problem_records(problems, threshold=0.24)
+        cluster_indices, _, _ = _cluster_problem_records(texts_all, threshold=0.24)
     except Exception:
         cluster_indices = [[i] for i in range(len(problems))]
 
+    # One tokenization pass plus a global n-gram document-frequency table;
+    # titles and summaries score clusters against it with plain Counters
+    # instead of fitting a sklearn vectorizer.
+    tokens_all = [
+        [t for t in _TOKEN_RE.findall(text[:MAX_CLUSTER_TEXT_CHARS].lower()) if t not in STOPWORDS]
+        for text in texts_all
+    ]
+    ngram_df = _build_ngram_df(tokens_all)
+    n_docs = max(1, len(tokens_all))
+
+    # Clusters partition the problem list, so one pass over the corpus fills
+    # every cluster's sector counts and subreddit set; no fresh Counter/set
+    # per cluster in the payload builder.
+    sectors_all = [str(p.get("sectorHint") or "General") for p in problems]
+    subs_all = [str(p.get("subreddit") or "") for p in problems]
+    cluster_of = [0] * len(problems)
+    for cid, idxs in enumerate(cluster_indices):
+        for i in idxs:
+            cluster_of[i] = cid
+    cluster_sectors: Dict[int, Counter] = defaultdict(Counter)
+    cluster_subs: Dict[int, set] = defaultdict(set)
+    for i, cid in enumerate(cluster_of):
+        cluster_sectors[cid][sectors_all[i]] += 1
+        if subs_all[i]:
+            cluster_subs[cid].add(subs_all[i])
+
     candidate_min_complaints = 3
     published_clusters = [idxs for idxs in cluster_indices if len(idxs) >= min_complaints]
     candidate_clusters = [idxs for idxs in cluster_indices if candidate_min_complaints <= len(idxs) < min_complaints]
 
+    cluster_cache = load_cluster_cache()
+
     def build_issue_payload(idxs: List[int], status: str) -> dict:
-        items = [problems[i] for i in idxs]
-        items.sort(key=lambda x: (int(x.get("score") or 0), float(x.get("createdUtc") or 0)), reverse=True)
+        ordered = sorted(idxs, key=lambda i: (scores_all[i], created_all[i]), reverse=True)
+        items = [problems[i] for i in ordered]
 
-        texts = [str(x.get("text") or "") for x in items]
-        title = _cluster_title(texts)
-        key = slugify(title)
-        sector = Counter([str(x.get("sectorHint") or "General") for x in items]).most_common(1)[0][0]
-        subreddits = sorted({str(x.get("subreddit") or "") for x in items if x.get("subreddit")})
+        texts = [texts_all[i] for i in ordered]
+        cid = cluster_of[idxs[0]]
+        sector = cluster_sectors[cid].most_common(1)[0][0]
+        subreddits = sorted(cluster_subs[cid])
         complaint_count = len(items)
-        total_score = sum(max(0, int(x.get("score") or 0)) for x in items)
+        total_score = sum(max(0, scores_all[i]) for i in ordered)
+
+        # Unchanged clusters keep their derived title/summary across cycles;
+        # pop + reinsert keeps the cache in recency order.
+        cache_key = hashlib.sha1(
+            ",".join(sorted(str(problems[i].get("id") or "") for i in idxs)).encode("utf-8")
+        ).hexdigest()
+        cached = cluster_cache.pop(cache_key, None)
+        if cached:
+            title = cached["title"]
+            summary = cached["summary"]
+        else:
+            title = _cluster_title(idxs, tokens_all, ngram_df, n_docs) or derive_issue_title(" ".join(texts[:5]))
+            summary = _cluster_summary(idxs, tokens_all, ngram_df, n_docs, complaint_count, len(subreddits))
+        cluster_cache[cache_key] = {"title": title, "summary": summary}
+
+        key = slugify(title)
         interested = max(10, int(complaint_count * 8 + total_score * 0.12))
         demand = "high" if complaint_count >= 30 else ("medium" if complaint_count >= 12 else "low")
 
@@ -486,7 +823,7 @@ def rebuild_curated_issues(min_complaints: int) -> None:
             "id": f"reddit-issue-{key}",
             "title": title,
             "sector": sector,
-            "summary": _cluster_summary(texts, complaint_count, len(subreddits)),
+            "summary": summary,
             "interested": interested,
             "teams": 0,
             "demand": demand,
@@ -511,10 +848,11 @@ def rebuild_curated_issues(min_complaints: int) -> None:
         reverse=True,
     )
 
-    CURATED_JSON.parent.mkdir(parents=True, exist_ok=True)
-    CURATED_JSON.write_text(json.dumps(published_issues, indent=2), encoding="utf-8")
-    CURATED_JS.write_text("window.redditProblems = " + json.dumps(published_issues, indent=2) + ";\n", encoding="utf-8")
-    CURATED_CANDIDATE_JSON.write_text(json.dumps(candidate_issues, indent=2), encoding="utf-8")
+    save_cluster_cache(cluster_cache)
+
+    write_json_array(CURATED_JSON, published_issues)
+    write_json_array(CURATED_JS, published_issues, prefix=b"window.redditProblems = ", suffix=b";\n")
+    write_json_array(CURATED_CANDIDATE_JSON, candidate_issues)
 
 
 def process_batch(batch: List[dict], model: str) -> Tuple[List[dict], List[dict], List[dict], int]:
@@ -525,11 +863,13 @@ def process_batch(batch: List[dict], model: str) -> Tuple[List[dict], List[dict]
 
     now_iso = datetime.now(timezone.utc).isoformat()
 
-    for item in batch:
-        text = str(item.get("text") or "").strip()
-        sector_hint = str(item.get("sectorHint") or "Business")
-        result = classify_item(text=text, sector_hint=sector_hint, model=model)
+    classifier_inputs = [
+        (str(item.get("text") or "").strip(), str(item.get("sectorHint") or "Business"))
+        for item in batch
+    ]
+    batch_results = classify_batch(classifier_inputs, model=model)
 
+    for item, (text, _), result in zip(batch, classifier_inputs, batch_results):
         issue_title = str(result.get("issue_title") or derive_issue_title(text)).strip() or "Operational Friction"
         issue_key = slugify(issue_title)
 
@@ -566,27 +906,38 @@ def process_batch(batch: List[dict], model: str) -> Tuple[List[dict], List[dict]
 
 
 def run_once(args: argparse.Namespace) -> None:
-    queue = read_jsonl(QUEUE_FILE)
-    if not queue:
+    batch, new_offset = read_batch_from_cursor(QUEUE_FILE, QUEUE_CURSOR_FILE, args.batch_size)
+    if not batch:
+        if (
+            CURATED_JSON.exists()
+            and PROBLEM_FILE.exists()
+            and CURATED_JSON.stat().st_mtime > PROBLEM_FILE.stat().st_mtime
+        ):
+            print("[ok] queue is empty | curated output up to date")
+            return
         rebuild_curated_issues(min_complaints=args.min_complaints)
         print("[ok] queue is empty | curated output refreshed")
         return
 
-    batch = queue[: args.batch_size]
-    remaining = queue[args.batch_size :]
+    pre_size = PROBLEM_FILE.stat().st_size if PROBLEM_FILE.exists() else 0
 
     problems_out, deleted_out, audit_out, solution_count = process_batch(batch, model=args.openai_model)
 
-    write_jsonl(QUEUE_FILE, remaining)
+    write_cursor(QUEUE_CURSOR_FILE, new_offset)
+    new_offset = compact_queue(QUEUE_FILE, QUEUE_CURSOR_FILE, new_offset)
     append_jsonl(PROBLEM_FILE, problems_out)
     append_jsonl(DELETED_FILE, deleted_out)
     append_jsonl(AUDIT_FILE, audit_out)
 
-    rebuild_curated_issues(min_complaints=args.min_complaints)
+    # The rebuild pipeline (TF-IDF, clustering, serialization) only depends
+    # on the problems file, so skip it on cycles that added no problems.
+    if problems_out or pre_size == 0 or not CURATED_JSON.exists():
+        rebuild_curated_issues(min_complaints=args.min_complaints)
 
+    remaining_bytes = max(0, QUEUE_FILE.stat().st_size - new_offset) if QUEUE_FILE.exists() else 0
     print(
         f"[ok] processed {len(batch)} | problems={len(problems_out)} | "
-        f"solutions_filtered={solution_count} | deleted={len(deleted_out)} | remaining={len(remaining)}"
+        f"solutions_filtered={solution_count} | deleted={len(deleted_out)} | queue_bytes_left={remaining_bytes}"
     )
 
 
@@ -9,26 +9,71 @@ Output:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import http.client
 import json
+import math
+import mmap
+import os
+import pickle
+import queue
 import random
 import re
+import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set
 
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # optional accelerator; bit-array fallback below
+    ScalableBloomFilter = None
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # optional accelerator; urllib fallback (no keep-alive)
+    requests = None
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json fallback
+    orjson = None
+try:
+    import xxhash
+except ImportError:  # optional accelerator; blake2b in the filter suffices
+    xxhash = None
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data" / "agent"
 QUEUE_FILE = DATA_DIR / "queue.jsonl"
 PROBLEM_FILE = DATA_DIR / "problems.jsonl"
 SOLUTION_FILE = DATA_DIR / "solutions.jsonl"
 DELETED_FILE = DATA_DIR / "deleted.jsonl"
+TEXT_BLOOM_FILE = DATA_DIR / "text_bloom.pkl"
 
 USER_AGENT = "ProblemPinRawScraper/1.0 (research use)"
 
+# Concurrent subreddit workers; network-bound, so threads scale well while
+# staying polite to Reddit's per-IP rate limits.
+SCRAPE_WORKERS = 8
+
+# Shared keep-alive session: reusing pooled connections skips the TCP/TLS
+# handshake on every call. urllib opens a fresh connection each time.
+if requests is not None:
+    _SESSION = requests.Session()
+    _SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+else:
+    _SESSION = None
+
 SUBREDDITS = [
     "entrepreneur",
     "startups",
@@ -125,6 +170,12 @@ SUBREDDIT_TO_SECTOR: Dict[str, str] = {
     "indiehackers": "Business",
 }
 
+# Intern the closed subreddit/sector vocabulary: every record stores one
+# shared string object per name instead of a fresh copy per comment.
+SUBREDDITS = [sys.intern(s) for s in SUBREDDITS]
+GENERAL_SUBREDDITS = [sys.intern(s) for s in GENERAL_SUBREDDITS]
+SUBREDDIT_TO_SECTOR = {sys.intern(k): sys.intern(v) for k, v in SUBREDDIT_TO_SECTOR.items()}
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Scrape Reddit comments into raw queue.")
@@ -158,46 +209,298 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# Fused: one alternation scans each string once, dropping URLs and
+# collapsing whitespace in the same pass. clean_text runs per comment body
+# and post title, so halving the bytes scanned matters at crawl volume.
+_CLEAN_RE = re.compile(r"(https?://\S+\s*)|\s+")
+
+
+def _clean_sub(match: re.Match) -> str:
+    if not match.group(1):
+        return " "
+    # A URL swallows its trailing whitespace, so when whitespace (or the
+    # start of the string) precedes it the whole gap collapses to nothing.
+    # After a non-space character the URL itself must still leave the single
+    # space the two-pass version produced: "a http://x b" -> "a b" but
+    # "(http://x) b" -> "( b".
+    start = match.start()
+    if start == 0 or match.string[start - 1].isspace():
+        return ""
+    return " " if match.group(1)[-1].isspace() else ""
+
+
 def clean_text(text: str) -> str:
-    text = re.sub(r"https?://\S+", "", text or "")
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
-
-
-def load_jsonl_ids(path: Path) -> Set[str]:
-    ids: Set[str] = set()
-    if not path.exists():
-        return ids
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                item = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            item_id = str(item.get("id") or item.get("commentId") or "").strip()
-            if item_id:
-                ids.add(item_id)
-    return ids
+    if not text:
+        return ""
+    return _CLEAN_RE.sub(_clean_sub, text).strip()
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over comment IDs.
+
+    Stdlib fallback for pybloom_live: millions of seen IDs fit in a few MB
+    of bits instead of ~200 bytes per set entry, at a tolerable false-
+    positive rate (a rare new comment skipped as already seen).
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-6) -> None:
+        bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._size = bits
+        self._bits = bytearray((bits + 7) // 8)
+        self._num_hashes = max(1, round(bits / capacity * math.log(2)))
+
+    def _positions(self, key: str) -> List[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big")
+        return [(h1 + i * h2) % self._size for i in range(self._num_hashes)]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
 
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
 
-def append_jsonl(path: Path, items: List[dict]) -> None:
-    if not items:
+
+def make_seen_filter():
+    if ScalableBloomFilter is not None:
+        return ScalableBloomFilter(initial_capacity=1_000_000, error_rate=1e-6)
+    return _BloomFilter()
+
+
+def _text_key(body: str) -> str:
+    # Cheap stable digest for content dedup; without xxhash the filter's own
+    # blake2b pass hashes the body directly.
+    if xxhash is not None:
+        return xxhash.xxh64(body.encode("utf-8")).hexdigest()
+    return body
+
+
+def _id_key(comment_id: str):
+    # Exact-membership key for the per-run ID set. A 64-bit int digest keeps
+    # the set at small-int size instead of one str object per ID and makes
+    # lookups a plain int compare; without xxhash the ID itself is the key.
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(comment_id.encode("utf-8"))
+    return comment_id
+
+
+def load_text_filter():
+    """Content-hash Bloom filter persisted across runs for duplicate bodies."""
+    if TEXT_BLOOM_FILE.exists():
+        try:
+            payload = TEXT_BLOOM_FILE.read_bytes()
+            if payload[:1] == b"\x78":  # zlib header; plain pickles start 0x80
+                payload = zlib.decompress(payload)
+            return pickle.loads(payload)
+        except Exception:
+            pass  # corrupt or from a different filter class; start fresh
+    if ScalableBloomFilter is not None:
+        return ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-5)
+    return _BloomFilter(capacity=1_000_000, error_rate=1e-5)
+
+
+def save_text_filter(text_filter) -> None:
+    TEXT_BLOOM_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = TEXT_BLOOM_FILE.with_suffix(".pkl.tmp")
+    # The bit array is mostly zeros until the filter nears capacity, so the
+    # pickle deflates from a few MB to a few KB read/written every cycle.
+    tmp_path.write_bytes(zlib.compress(pickle.dumps(text_filter), level=3))
+    os.replace(tmp_path, TEXT_BLOOM_FILE)
+
+
+# Every writer in the pipeline serializes "id" as the first record key, so
+# one anchored bytes scan over the whole file yields the IDs without line
+# splitting or JSON decoding.
+_ID_HEAD_RE = re.compile(rb'^\{"(?:id|commentId)":\s?"([^"\\]+)"', re.M)
+
+
+def load_jsonl_ids(path: Path, sink) -> None:
+    """Scan IDs from a JSONL file into sink (anything with .add)."""
+    if not path.exists() or path.stat().st_size == 0:
         return
+    with path.open("rb") as handle:
+        # mmap lets the regex walk the page cache directly; no per-line str
+        # objects and no decode pass over fields we never read.
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for match in _ID_HEAD_RE.finditer(view):
+                sink.add(match.group(1).decode("utf-8"))
+
+
+@dataclass(slots=True)
+class QueueRecord:
+    """One pending queue item; slotted to avoid per-record dict overhead.
+
+    Field order matters: serializers emit attributes in declaration order,
+    and the ID readers fast-path lines that start with the "id" key.
+    """
+
+    id: str
+    platform: str
+    subreddit: str
+    sectorHint: str
+    postId: str
+    postTitle: str
+    author: str
+    score: int
+    createdUtc: float
+    sourceUrl: str
+    text: str
+    ingestedAt: str
+    status: str
+
+
+# Join batches into slices of at most this many encoded bytes so one write
+# call lands per slice without holding an unbounded payload string.
+_APPEND_SLICE_BYTES = 8 * 1024 * 1024
+
+
+def append_jsonl(path: Path, items: Iterable[dict]) -> None:
+    items = iter(items)
+    first = next(items, None)
+    if first is None:
+        return
+    items = chain([first], items)
+    if orjson is not None:
+        dumps = orjson.dumps  # serializes dataclasses natively
+    else:
+        dumps = lambda item: json.dumps(  # noqa: E731
+            asdict(item) if is_dataclass(item) else item, ensure_ascii=False
+        ).encode("utf-8")
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
+    with path.open("ab", buffering=1 << 20) as handle:
+        lines: List[bytes] = []
+        pending = 0
         for item in items:
-            handle.write(json.dumps(item, ensure_ascii=False) + "\n")
+            line = dumps(item)
+            lines.append(line)
+            pending += len(line) + 1
+            if pending >= _APPEND_SLICE_BYTES:
+                handle.write(b"\n".join(lines) + b"\n")
+                lines, pending = [], 0
+        if lines:
+            handle.write(b"\n".join(lines) + b"\n")
+
+
+class QueueBuffer:
+    """Background writer for the raw queue.
+
+    Records go onto a bounded handoff queue drained by a dedicated writer
+    thread in batches, so fetch workers never block on disk; durability
+    still arrives incrementally (at most one in-flight batch plus the
+    handoff queue is lost on crash).
+    """
+
+    _SENTINEL = object()
+
+    def __init__(self, path: Path, batch_size: int = 200) -> None:
+        self._path = path
+        self._batch_size = batch_size
+        self._handoff: queue.Queue = queue.Queue(maxsize=1000)
+        self._count_lock = threading.Lock()
+        self._error: Optional[Exception] = None
+        self.total = 0
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
+    def add(self, record: "QueueRecord") -> None:
+        if self._error is not None:
+            raise self._error
+        self._handoff.put(record)
+        with self._count_lock:
+            self.total += 1
+
+    def close(self) -> None:
+        """Flush everything, stop the writer thread, re-raise any write error."""
+        self._handoff.put(self._SENTINEL)
+        self._writer.join()
+        if self._error is not None:
+            raise self._error
+
+    def _write(self, batch: List["QueueRecord"]) -> None:
+        if self._error is not None:
+            return  # writes already failed; keep draining so add() never blocks
+        try:
+            append_jsonl(self._path, batch)
+        except Exception as exc:
+            # Remember the failure for add()/close() to surface; the loop
+            # keeps consuming (and dropping) so the bounded handoff queue
+            # cannot fill up and deadlock the fetch workers.
+            self._error = exc
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._handoff.get()
+            if item is self._SENTINEL:
+                return
+            batch = [item]
+            while len(batch) < self._batch_size:
+                try:
+                    nxt = self._handoff.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is self._SENTINEL:
+                    self._write(batch)
+                    return
+                batch.append(nxt)
+            self._write(batch)
+
+
+# One keep-alive socket per worker thread for the stdlib path: reusing the
+# connection skips DNS resolution and the TLS handshake on every call.
+_REDDIT_HOST = "www.reddit.com"
+_conn_local = threading.local()
+
+
+def _reddit_connection(fresh: bool = False) -> http.client.HTTPSConnection:
+    conn = getattr(_conn_local, "conn", None)
+    if fresh and conn is not None:
+        conn.close()
+        conn = None
+    if conn is None:
+        conn = http.client.HTTPSConnection(_REDDIT_HOST, timeout=35)
+        _conn_local.conn = conn
+    return conn
+
+
+def _pinned_get(url: str, headers: Dict[str, str]):
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    conn = _reddit_connection()
+    try:
+        conn.request("GET", path, headers=headers)
+        return conn.getresponse()
+    except (http.client.HTTPException, OSError):
+        # Stale keep-alive socket; reconnect once before the outer retry.
+        conn = _reddit_connection(fresh=True)
+        conn.request("GET", path, headers=headers)
+        return conn.getresponse()
 
 
 def request_json(url: str, max_retries: int, sleep: float) -> Optional[dict]:
-    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    headers = {"User-Agent": USER_AGENT}
     for attempt in range(max_retries + 1):
         try:
-            with urllib.request.urlopen(req, timeout=35) as response:
-                return json.loads(response.read().decode("utf-8"))
+            if _SESSION is not None:
+                response = _SESSION.get(url, headers=headers, timeout=35)
+                if response.status_code == 429 and attempt < max_retries:
+                    time.sleep(sleep * (2 ** attempt))
+                    continue
+                response.raise_for_status()
+                if orjson is not None:
+                    return orjson.loads(response.content)
+                return response.json()
+            response = _pinned_get(url, headers)
+            payload = response.read()  # drain so the socket can be reused
+            if response.status == 429 and attempt < max_retries:
+                time.sleep(sleep * (2 ** attempt))
+                continue
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            if orjson is not None:
+                return orjson.loads(payload)
+            return json.loads(payload.decode("utf-8"))
         except urllib.error.HTTPError as exc:
             if exc.code == 429 and attempt < max_retries:
                 time.sleep(sleep * (2 ** attempt))
@@ -223,16 +526,26 @@ def fetch_posts(subreddit: str, sort: str, limit: int, max_retries: int, sleep:
     return payload.get("data", {}).get("children", [])
 
 
+# The only comment fields read downstream; projecting to these during the
+# walk lets the 40-odd remaining fields (and the nested reply trees) be
+# collected as soon as the payload dict is dropped.
+_COMMENT_FIELDS = ("id", "body", "author", "score", "created_utc", "permalink")
+
+
 def flatten_comments(children: Iterable[dict], out: List[dict]) -> None:
-    for child in children:
+    # Iterative walk: deep reply chains would otherwise pay per-call overhead
+    # and can hit the recursion limit on pathological threads.
+    stack = deque(children)
+    while stack:
+        child = stack.popleft()
         if child.get("kind") != "t1":
             continue
-        data = child.get("data", {})
+        data = child.get("data") or {}
         if data:
-            out.append(data)
+            out.append({field: data.get(field) for field in _COMMENT_FIELDS})
         replies = data.get("replies")
         if isinstance(replies, dict):
-            flatten_comments(replies.get("data", {}).get("children", []), out)
+            stack.extend(replies.get("data", {}).get("children", ()))
 
 
 def fetch_comments(subreddit: str, post_id: str, limit: int, max_retries: int, sleep: float) -> List[dict]:
@@ -247,17 +560,26 @@ def fetch_comments(subreddit: str, post_id: str, limit: int, max_retries: int, s
     return out
 
 
-def main() -> None:
-    args = parse_args()
-    now_iso = datetime.now(timezone.utc).isoformat()
+def main(args: Optional[argparse.Namespace] = None) -> None:
+    if args is None:
+        args = parse_args()
+    # Stamp the run once; per-comment datetime construction is wasted work
+    # when every record in a cycle shares the same ingest instant anyway.
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    now_ts = now.timestamp()
 
-    known_ids = set()
+    known_ids = make_seen_filter()
     for path in (QUEUE_FILE, PROBLEM_FILE, SOLUTION_FILE, DELETED_FILE):
-        known_ids.update(load_jsonl_ids(path))
+        load_jsonl_ids(path, known_ids)
+    # Exact set for IDs first seen this run; keeps intra-run dedup free of
+    # Bloom false positives. Holds _id_key digests, not the ID strings.
+    run_ids: Set = set()
+    text_bf = load_text_filter()
 
-    new_items: List[dict] = []
+    writer = QueueBuffer(QUEUE_FILE)
 
-    selected_subreddits = [s.strip() for s in args.subreddits.split(",") if s.strip()] if args.subreddits else list(SUBREDDITS)
+    selected_subreddits = [sys.intern(s.strip()) for s in args.subreddits.split(",") if s.strip()] if args.subreddits else list(SUBREDDITS)
     if args.include_general:
         selected_subreddits.extend(GENERAL_SUBREDDITS)
     # Deduplicate while preserving order.
@@ -267,9 +589,10 @@ def main() -> None:
     if args.max_subreddits > 0:
         selected_subreddits = selected_subreddits[: args.max_subreddits]
 
-    for subreddit in selected_subreddits:
-        sector = SUBREDDIT_TO_SECTOR.get(subreddit, "Business")
-        posts: Dict[str, dict] = {}
+    items_lock = threading.Lock()
+
+    def fetch_subreddit_posts(subreddit: str) -> List[tuple]:
+        posts: Dict[str, str] = {}
 
         for sort in ("hot", "new", "top"):
             try:
@@ -294,68 +617,112 @@ def main() -> None:
                 post_id = data.get("id")
                 if not post_id:
                     continue
+                # hot/new/top overlap heavily; skip posts an earlier sort
+                # already captured before touching the rest of the payload.
+                if post_id in posts:
+                    continue
                 if data.get("stickied"):
                     continue
-                posts[post_id] = data
+                # Only the title is read downstream; dropping the rest of the
+                # 50+ field listing payload here keeps retained memory small.
+                posts[post_id] = data.get("title") or ""
 
             time.sleep(args.sleep)
 
-        for post_id, post in posts.items():
-            try:
-                comments = fetch_comments(
-                    subreddit=subreddit,
-                    post_id=post_id,
-                    limit=args.comments_per_post,
-                    max_retries=args.max_retries,
-                    sleep=args.sleep,
-                )
-            except urllib.error.HTTPError as exc:
-                print(f"[warn] /r/{subreddit} post {post_id}: HTTP {exc.code}")
-                time.sleep(args.sleep)
-                continue
-            except Exception as exc:
-                print(f"[warn] /r/{subreddit} post {post_id}: {exc}")
-                time.sleep(args.sleep)
-                continue
+        return [(subreddit, post_id, title) for post_id, title in posts.items()]
 
-            post_title = clean_text(post.get("title") or "")
+    def process_post(subreddit: str, post_id: str, post_title_raw: str) -> None:
+        sector = SUBREDDIT_TO_SECTOR.get(subreddit, "Business")
+        try:
+            comments = fetch_comments(
+                subreddit=subreddit,
+                post_id=post_id,
+                limit=args.comments_per_post,
+                max_retries=args.max_retries,
+                sleep=args.sleep,
+            )
+        except urllib.error.HTTPError as exc:
+            print(f"[warn] /r/{subreddit} post {post_id}: HTTP {exc.code}")
+            time.sleep(args.sleep)
+            return
+        except Exception as exc:
+            print(f"[warn] /r/{subreddit} post {post_id}: {exc}")
+            time.sleep(args.sleep)
+            return
 
-            for comment in comments:
-                comment_id = str(comment.get("id") or "").strip()
-                if not comment_id or comment_id in known_ids:
-                    continue
+        post_title = clean_text(post_title_raw)
+        batch: List[tuple] = []
+        batch_append = batch.append
 
-                body = clean_text(comment.get("body") or "")
-                if not body or body in ("[deleted]", "[removed]"):
-                    continue
-                if len(body) < args.min_length:
-                    continue
+        for comment in comments:
+            comment_id = str(comment.get("id") or "").strip()
+            # The Bloom filter is read-only once loaded, so this check is
+            # safe outside the lock; run_ids is checked under it below.
+            if not comment_id or comment_id in known_ids:
+                continue
 
-                permalink = comment.get("permalink") or ""
-                created_utc = float(comment.get("created_utc") or datetime.now(timezone.utc).timestamp())
-
-                record = {
-                    "id": comment_id,
-                    "platform": "reddit",
-                    "subreddit": subreddit,
-                    "sectorHint": sector,
-                    "postId": post_id,
-                    "postTitle": post_title,
-                    "author": comment.get("author") or "unknown",
-                    "score": int(comment.get("score") or 0),
-                    "createdUtc": created_utc,
-                    "sourceUrl": f"https://www.reddit.com{permalink}" if permalink else "",
-                    "text": body,
-                    "ingestedAt": now_iso,
-                    "status": "pending",
-                }
-                new_items.append(record)
-                known_ids.add(comment_id)
+            body = clean_text(comment.get("body") or "")
+            if not body or body in ("[deleted]", "[removed]"):
+                continue
+            if len(body) < args.min_length:
+                continue
 
-            time.sleep(args.sleep)
+            permalink = comment.get("permalink") or ""
+            created_utc = float(comment.get("created_utc") or now_ts)
 
-    append_jsonl(QUEUE_FILE, new_items)
-    print(f"[ok] added to queue: {len(new_items)}")
+            batch_append(
+                (_id_key(comment_id),
+                 _text_key(body),
+                 QueueRecord(
+                    id=comment_id,
+                    platform="reddit",
+                    subreddit=subreddit,
+                    sectorHint=sector,
+                    postId=post_id,
+                    postTitle=post_title,
+                    author=comment.get("author") or "unknown",
+                    score=int(comment.get("score") or 0),
+                    createdUtc=created_utc,
+                    sourceUrl=f"https://www.reddit.com{permalink}" if permalink else "",
+                    text=body,
+                    ingestedAt=now_iso,
+                    status="pending",
+                 ))
+            )
+
+        with items_lock:
+            accepted = []
+            for id_key, text_key, record in batch:
+                if id_key in run_ids:
+                    continue
+                # Content-hash check drops exact-text duplicates (reposts,
+                # copy-paste replies, bots) that carry distinct comment IDs.
+                if text_key in text_bf:
+                    continue
+                run_ids.add(id_key)
+                text_bf.add(text_key)
+                accepted.append(record)
+        for record in accepted:
+            writer.add(record)
+
+        time.sleep(args.sleep)
+
+    # Two-phase fan-out: gather every post job first, then let all comment
+    # fetches across subreddits share the worker budget, keeping the full
+    # SCRAPE_WORKERS requests in flight until the tail of the crawl.
+    try:
+        with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as pool:
+            post_jobs: List[tuple] = []
+            for jobs in pool.map(fetch_subreddit_posts, selected_subreddits):
+                post_jobs.extend(jobs)
+            for future in [pool.submit(process_post, *job) for job in post_jobs]:
+                future.result()
+    finally:
+        # Always stop the writer thread: the in-process orchestrator reuses
+        # this interpreter, and an abandoned writer would leak per cycle.
+        writer.close()
+    save_text_filter(text_bf)
+    print(f"[ok] added to queue: {writer.total}")
     print(f"[ok] queue file: {QUEUE_FILE}")
 
 